@@ -6,19 +6,54 @@
 
 import asyncio
 import aiomysql
+import atexit
+import functools
+import json
 import logging
+import logging.handlers
+import os
+import pickle
+import sys
+import threading
+import time
+from queue import SimpleQueue
 from pymysqlreplication import BinLogStreamReader
+from pymysqlreplication.event import QueryEvent, XidEvent
 from pymysqlreplication.row_event import (
     DeleteRowsEvent,
     UpdateRowsEvent,
     WriteRowsEvent,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# uvloop is optional, the stdlib event loop is used when it is not installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+def setup_logging():
+    """Configure logging, called from __main__ only
+
+    Records are handed to a queue and written to the stream by a listener
+    thread, so the workers do not wait on the write. QueueHandler still
+    merges the message arguments on the calling thread; the listener adds
+    the timestamp and level.
+    """
+    log_queue = SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    logging.basicConfig(level=logging.INFO, format='%(message)s',
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
 # Main PreDB Mysql connection settings
+# Protocol compression (CLIENT.COMPRESS) must not be enabled here, PyMySQL
+# rejects the compress option and cannot read compressed packets, so the
+# binlog stream would break
 MYSQL_SETTINGS = {
     "host": "<host_here>",
     "port": <port_here>,
@@ -41,13 +76,60 @@ group_max_id_known = 0
 sections = {}
 section_max_id_known = 0
 
-# Skip releases with IDs lower than this (for initial setup)
-#last_known_insert = 14125440
-last_known_insert = 14130526
+# State files live next to the script, not in the working directory,
+# which for a daemon is often / or not writable
+STATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Groups and sections are cached on disk between restarts; while the cache
+# is younger than CACHE_MAX_AGE seconds only rows newer than the cached
+# max ID are fetched from the database
+GROUPS_CACHE_FILE = os.path.join(STATE_DIR, 'groups.cache')
+SECTIONS_CACHE_FILE = os.path.join(STATE_DIR, 'sections.cache')
+CACHE_MAX_AGE = 24 * 3600
+
+# The binlog position of the last fully written transaction is saved here
+# every CHECKPOINT_EVERY rows or CHECKPOINT_INTERVAL seconds and streaming
+# resumes from it on restart. Without it, streaming starts at the current
+# master position.
+POSITION_FILE = os.path.join(STATE_DIR, 'binlog.position')
+CHECKPOINT_EVERY = 1000
+CHECKPOINT_INTERVAL = 60
 
 # Sphinx connection pool
 sphinx_pool = None
 
+# Batching of Sphinx writes: rows are buffered and flushed as one multi-row
+# statement once BATCH_MIN rows are pending or FLUSH_MS has elapsed
+BATCH_MIN = 100
+BATCH_MAX = 500
+FLUSH_MS = 200
+
+# Column order of releases_rt: id, releasename (field), releasename (attr),
+# groupid, sectionid, status, pretime, size, files
+_REPLACE_SQL = "REPLACE INTO releases_rt VALUES "
+_REPLACE_ROW = "(%s,%s,%s,%s,%s,%s,%s,%s,%s)"
+_DELETE_SQL = "DELETE FROM releases_rt WHERE id IN "
+
+# Columns of releases that end up in releases_rt
+_INDEXED = ('id', 'releasename', 'groupid', 'sectionid', 'status', 'pretime', 'size', 'files')
+
+# Binlog rows are read in a separate thread and sharded by release id over
+# WORKERS coroutines, each with its own bounded queue and Sphinx connection.
+# Rows for one id always go to the same worker and stay in order.
+WORKERS = 4
+QUEUE_MAXSIZE = 1024
+
+# Sphinx write counters, logged as rates every STATS_INTERVAL seconds
+# instead of one log line per row
+STATS_INTERVAL = 1.0
+_stats = {'replaced': 0, 'deleted': 0, 'last_log': 0.0}
+
+# Warn when rows wait in the queue longer than this many seconds,
+# at most once every QUEUE_LAG_WARN_INTERVAL seconds
+QUEUE_LAG_WARN = 2.0
+QUEUE_LAG_WARN_INTERVAL = 10.0
+last_lag_warning = 0.0
+
 async def init_sphinx_pool():
     """Initialize the Sphinx connection pool"""
     global sphinx_pool
@@ -56,149 +138,407 @@ async def init_sphinx_pool():
         port=SPHINX_SETTINGS['port'],
         user=SPHINX_SETTINGS['user'],
         password=SPHINX_SETTINGS['passwd'],
+        # One connection per worker, plus headroom for reconnects
+        minsize=WORKERS,
+        maxsize=WORKERS + 2,
+        pool_recycle=3600,
+        charset='utf8mb4',
+        connect_timeout=5,
         autocommit=True
     )
-    logger.info("Sphinx connection pool initialized")
+    logger.info(f"Sphinx connection pool initialized ({WORKERS}-{WORKERS + 2} connections)")
 
-async def execute_sphinx_command(query, params=None):
+async def execute_sphinx_command(conn, query, params=None):
     """Execute a command on Sphinx RT index"""
-    global sphinx_pool
     try:
-        async with sphinx_pool.acquire() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(query, params)
-                return True
+        async with conn.cursor() as cur:
+            await cur.execute(query, params)
+            return True
     except Exception as e:
-        logger.error(f"Sphinx command failed: {query} - Error: {e}")
+        logger.error(f"Sphinx command failed: {query[:200]} - Error: {e}")
         return False
 
-async def add_release_to_sphinx(release_data):
-    """Add or update a release in Sphinx RT index"""
-    replace_query = """
-        REPLACE INTO releases_rt VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    params = (
-        release_data['id'],
-        release_data.get('releasename', ''),
-        release_data.get('releasename', ''),
-        release_data.get('groupid') or 0,
-        release_data.get('sectionid') or 0,
-        release_data.get('status') or 0,
-        release_data.get('pretime') or 0,
-        release_data.get('size') or 0.0,
-        release_data.get('files') or 0
+@functools.lru_cache(maxsize=None)
+def _delete_sql(rows):
+    """DELETE statement for a batch of ids, one per batch size"""
+    return _DELETE_SQL + "(" + ",".join(["%s"] * rows) + ")"
+
+def _row_to_params(v, _g=dict.get):
+    """Build the releases_rt REPLACE params tuple for a release row"""
+    return (
+        v['id'],
+        v['releasename'],
+        v['releasename'],
+        _g(v, 'groupid') or 0,
+        _g(v, 'sectionid') or 0,
+        _g(v, 'status') or 0,
+        _g(v, 'pretime') or 0,
+        _g(v, 'size') or 0.0,
+        _g(v, 'files') or 0
     )
-    
-    success = await execute_sphinx_command(replace_query, params)
+
+def _row_to_sql(escape, row):
+    """Render one REPLACE row, escaping the release name once for both columns"""
+    name = escape(row[1])
+    return _REPLACE_ROW % (
+        escape(row[0]), name, name, escape(row[3]), escape(row[4]),
+        escape(row[5]), escape(row[6]), escape(row[7]), escape(row[8])
+    )
+
+async def add_releases_to_sphinx(conn, batch):
+    """Add or update a batch of releases in Sphinx RT index"""
+    # SphinxQL has no server-side prepared statements, so the rows are
+    # rendered here and sent without a second %-substitution pass
+    escape = conn.escape
+    query = _REPLACE_SQL + ",".join([_row_to_sql(escape, row) for row in batch])
+    success = await execute_sphinx_command(conn, query)
     if success:
-        logger.info(f"Replaced release: {release_data['id']} - {release_data['releasename']}")
+        _stats['replaced'] += len(batch)
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in batch:
+                logger.debug(f"Replaced release: {row[0]} - {row[1]}")
     return success
 
-async def remove_release_from_sphinx(release_id):
-    """Remove a release from Sphinx RT index"""
-    delete_query = "DELETE FROM releases_rt WHERE id = %s"
-    success = await execute_sphinx_command(delete_query, (release_id,))
+async def remove_releases_from_sphinx(conn, release_ids):
+    """Remove a batch of releases from Sphinx RT index"""
+    success = await execute_sphinx_command(conn, _delete_sql(len(release_ids)), release_ids)
     if success:
-        logger.info(f"Deleted release: {release_id}")
+        _stats['deleted'] += len(release_ids)
+        if logger.isEnabledFor(logging.DEBUG):
+            for release_id in release_ids:
+                logger.debug(f"Deleted release: {release_id}")
     return success
 
-async def main():
-    """Main binlog monitoring loop"""
-    logger.info("Starting binlog stream reader...")
-    
-    stream = BinLogStreamReader(
-        connection_settings=MYSQL_SETTINGS,
-        server_id=2,
-        only_events=[DeleteRowsEvent, WriteRowsEvent, UpdateRowsEvent],
-        blocking=True
-    )
+def queue_replace(pending_ops, params):
+    """Buffer a release for the next REPLACE batch, True once a flush is due"""
+    # Only the last operation per id within a flush window is sent
+    pending_ops[params[0]] = ('R', params)
+    return len(pending_ops) >= BATCH_MIN
 
-    for binlogevent in stream:
-        # Only process releases table events
-        if binlogevent.table != "releases":
-            continue
+def queue_delete(pending_ops, release_id):
+    """Buffer a release id for the next DELETE batch, True once a flush is due"""
+    pending_ops[release_id] = ('D', (release_id,))
+    return len(pending_ops) >= BATCH_MIN
 
-        for row in binlogevent.rows:
-            try:
-                if isinstance(binlogevent, DeleteRowsEvent):
-                    release_id = row["values"]['id']
-                    await remove_release_from_sphinx(release_id)
-
-                elif isinstance(binlogevent, WriteRowsEvent):
-                    # New release added
-                    values = row['values']
-                    
-                    # Skip if ID is too low (for initial setup)
-                    if values['id'] < last_known_insert:
-                        continue
-                    
-                    # Only index releases that are not deleted (status != 4)
-                    if values.get('status', 0) == 4:
-                        continue
-                    
-                    release_data = {
-                        'id': values['id'],
-                        'releasename': values['releasename'],
-                        'groupid': values.get('groupid', 0),
-                        'sectionid': values.get('sectionid', 0),
-                        'status': values.get('status', 0),
-                        'pretime': values.get('pretime', 0),
-                        'files': values.get('files', 0),
-                        'size': values.get('size', 0.0)
-                    }
-                    
-                    await add_release_to_sphinx(release_data)
-
-                elif isinstance(binlogevent, UpdateRowsEvent):
-                    # Release updated
-                    before_values = row['before_values']
-                    after_values = row['after_values']
-                    
-                    # If status changed to deleted (4), remove from index
-                    if after_values.get('status') == 4 and before_values.get('status') != 4:
-                        await remove_release_from_sphinx(after_values['id'])
-                    
-                    # If status changed from deleted to active, add to index
-                    elif before_values.get('status') == 4 and after_values.get('status') != 4:
-                        release_data = {
-                            'id': after_values['id'],
-                            'releasename': after_values['releasename'],
-                            'groupid': after_values.get('groupid', 0),
-                            'sectionid': after_values.get('sectionid', 0),
-                            'status': after_values.get('status', 0),
-                            'pretime': after_values.get('pretime', 0),
-                            'files': after_values.get('files', 0),
-                            'size': after_values.get('size', 0.0)
-                        }
-                        await add_release_to_sphinx(release_data)
-                    
-                    # If record is active and fields changed, update index
-                    elif after_values.get('status', 0) != 4:
-                        release_data = {
-                            'id': after_values['id'],
-                            'releasename': after_values['releasename'],
-                            'groupid': after_values.get('groupid', 0),
-                            'sectionid': after_values.get('sectionid', 0),
-                            'status': after_values.get('status', 0),
-                            'pretime': after_values.get('pretime', 0),
-                            'files': after_values.get('files', 0),
-                            'size': after_values.get('size', 0.0)
-                        }
-                        await add_release_to_sphinx(release_data)
+async def write_batch(conn, write, rows):
+    """Write one batch, retrying it once after reconnecting if it fails"""
+    if await write(conn, rows):
+        return
+
+    # A lost connection is closed by aiomysql, ping() opens it again
+    logger.warning(f"Retrying {len(rows)} rows on a fresh Sphinx connection")
+    await conn.ping()
+    if await write(conn, rows):
+        return
+
+    # Stop instead of moving on, the saved binlog position is still before
+    # these rows, so a restart replays them
+    raise RuntimeError(f"Sphinx write of {len(rows)} rows failed after a retry")
+
+async def flush_pending(conn, pending_ops):
+    """Write out buffered REPLACEs and DELETEs in chunks of at most BATCH_MAX rows"""
+    if not pending_ops:
+        return
+
+    batch = []
+    release_ids = []
+    for op, params in pending_ops.values():
+        if op == 'R':
+            batch.append(params)
+        else:
+            release_ids.append(params[0])
+    pending_ops.clear()
+
+    # Workers hold their connection for their whole life, so the pool never
+    # gets to drop one the server closed while it sat idle. Check it here,
+    # ping() reconnects in place when it is gone.
+    await conn.ping()
+
+    # Every id appears once, so the REPLACEs and DELETEs can go in any order
+    for i in range(0, len(batch), BATCH_MAX):
+        await write_batch(conn, add_releases_to_sphinx, batch[i:i + BATCH_MAX])
+
+    for i in range(0, len(release_ids), BATCH_MAX):
+        await write_batch(conn, remove_releases_from_sphinx, release_ids[i:i + BATCH_MAX])
+
+def load_position():
+    """Load the saved binlog position, (None, None) if there is none"""
+    try:
+        with open(POSITION_FILE) as f:
+            position = json.load(f)
+        return position['log_file'], position['log_pos']
+    except FileNotFoundError:
+        return None, None
+    except Exception as e:
+        logger.warning(f"Failed to load binlog position from {POSITION_FILE}: {e}")
+        return None, None
+
+def save_position(log_file, log_pos):
+    """Save the binlog position, replacing the file atomically"""
+    try:
+        tmp_file = POSITION_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump({'log_file': log_file, 'log_pos': log_pos}, f)
+        os.replace(tmp_file, POSITION_FILE)
+    except Exception as e:
+        logger.error(f"Failed to save binlog position to {POSITION_FILE}: {e}")
+
+def checkpoint(marker):
+    """Save the binlog position once every worker has written its rows up to it"""
+    marker['pending'] -= 1
+    if marker['pending'] == 0:
+        save_position(marker['log_file'], marker['log_pos'])
+        logger.debug(f"Saved binlog position {marker['log_file']}:{marker['log_pos']}")
+
+def handle_row(binlogevent, row, pending_ops):
+    """Buffer the Sphinx operation for a releases row, True once a flush is due"""
+    if isinstance(binlogevent, DeleteRowsEvent):
+        release_id = row["values"]['id']
+        return queue_delete(pending_ops, release_id)
+
+    elif isinstance(binlogevent, WriteRowsEvent):
+        # New release added
+        values = row['values']
+
+        # Only index releases that are not deleted (status != 4)
+        if values.get('status', 0) == 4:
+            return False
+
+        return queue_replace(pending_ops, _row_to_params(values))
+
+    elif isinstance(binlogevent, UpdateRowsEvent):
+        # Release updated
+        before_values = row['before_values']
+        after_values = row['after_values']
+        before_status = before_values.get('status')
+        after_status = after_values.get('status')
+
+        # If status changed to deleted (4), remove from index
+        if after_status == 4 and before_status != 4:
+            return queue_delete(pending_ops, after_values['id'])
+
+        # If status changed from deleted to active, add to index
+        elif before_status == 4 and after_status != 4:
+            return queue_replace(pending_ops, _row_to_params(after_values))
+
+        # If record is active and fields changed, update index
+        elif after_status != 4:
+            # Changes to columns that are not indexed are invisible to search
+            if all(before_values.get(k) == after_values.get(k) for k in _INDEXED):
+                return False
+
+            return queue_replace(pending_ops, _row_to_params(after_values))
 
+    return False
+
+async def report_stats():
+    """Log Sphinx write rates every STATS_INTERVAL seconds while there is activity"""
+    # Start the first window now, not at import, so startup time is not
+    # counted in the first rate
+    _stats['last_log'] = time.monotonic()
+    while True:
+        await asyncio.sleep(STATS_INTERVAL)
+        now = time.monotonic()
+        elapsed = now - _stats['last_log']
+        if _stats['replaced'] or _stats['deleted']:
+            logger.info(
+                f"rate: {_stats['replaced'] / elapsed:.0f} repl/s, "
+                f"{_stats['deleted'] / elapsed:.0f} del/s"
+            )
+        _stats['replaced'] = 0
+        _stats['deleted'] = 0
+        _stats['last_log'] = now
+
+def check_queue_lag(enqueued_at):
+    """Warn when rows sit in the queue for longer than QUEUE_LAG_WARN"""
+    global last_lag_warning
+    now = time.monotonic()
+    lag = now - enqueued_at
+    if lag > QUEUE_LAG_WARN and now - last_lag_warning >= QUEUE_LAG_WARN_INTERVAL:
+        last_lag_warning = now
+        logger.warning(f"Binlog rows are waiting {lag:.1f}s in the queue ({WORKERS} workers)")
+
+async def worker(queue):
+    """Consume the binlog rows of one shard and write them to Sphinx"""
+    loop = asyncio.get_running_loop()
+    # Held for the lifetime of the worker instead of being acquired per write
+    conn = await sphinx_pool.acquire()
+    # Release id -> ('R', params) or ('D', (id,))
+    pending_ops = {}
+    flush_at = None
+
+    try:
+        while True:
+            if flush_at is None or not queue.empty():
+                item = await queue.get()
+            else:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(flush_at - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    await flush_pending(conn, pending_ops)
+                    flush_at = None
+                    continue
+
+            if item is None:
+                await flush_pending(conn, pending_ops)
+                break
+
+            enqueued_at, binlogevent, row = item
+            check_queue_lag(enqueued_at)
+            if binlogevent is None:
+                # Checkpoint marker, row holds the binlog position. Everything
+                # this worker got before it is written once the flush returns.
+                await flush_pending(conn, pending_ops)
+                flush_at = None
+                checkpoint(row)
+                continue
+
+            try:
+                due = handle_row(binlogevent, row, pending_ops)
             except Exception as e:
                 logger.error(f"Error processing binlog event: {e}")
                 logger.error(f"Event: {binlogevent}")
                 logger.error(f"Row: {row}")
                 continue
 
-    stream.close()
+            if flush_at is None and pending_ops:
+                flush_at = loop.time() + FLUSH_MS / 1000
+            if due or (flush_at is not None and loop.time() >= flush_at):
+                await flush_pending(conn, pending_ops)
+                flush_at = None
+    finally:
+        sphinx_pool.release(conn)
+
+def _binlog_reader_thread(queues, loop, done):
+    """Read the binlog stream and hand releases rows over to the event loop"""
+    log_file, log_pos = load_position()
+    if log_file:
+        logger.info(f"Resuming binlog stream from {log_file}:{log_pos}")
+    else:
+        logger.info("No saved binlog position, starting from the current master position")
+
+    stream = BinLogStreamReader(
+        connection_settings=MYSQL_SETTINGS,
+        server_id=2,
+        # Transaction ends are needed to know where it is safe to resume
+        only_events=[DeleteRowsEvent, WriteRowsEvent, UpdateRowsEvent, XidEvent, QueryEvent],
+        # Row events for other tables are skipped before being decoded
+        only_schemas=['predb'],
+        only_tables=['releases'],
+        # Keep an idle stream alive without relying on other server traffic
+        slave_heartbeat=30,
+        log_file=log_file,
+        log_pos=log_pos,
+        resume_stream=True,
+        blocking=True
+    )
+
+    def put(queue, item):
+        # Blocks while the queue is full, throttling the reader to the speed
+        # of the workers
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    rows_since_checkpoint = 0
+    last_checkpoint = time.monotonic()
+    try:
+        for binlogevent in stream:
+            if isinstance(binlogevent, (XidEvent, QueryEvent)):
+                # Only a committed transaction is a safe place to resume from,
+                # row events need the table map from earlier in the transaction
+                if isinstance(binlogevent, QueryEvent) and binlogevent.query != 'COMMIT':
+                    continue
+                now = time.monotonic()
+                if rows_since_checkpoint >= CHECKPOINT_EVERY or (
+                        rows_since_checkpoint and now - last_checkpoint >= CHECKPOINT_INTERVAL):
+                    # Every worker has to pass the marker before it is saved
+                    marker = {'log_file': stream.log_file, 'log_pos': stream.log_pos, 'pending': WORKERS}
+                    for queue in queues:
+                        put(queue, (now, None, marker))
+                    rows_since_checkpoint = 0
+                    last_checkpoint = now
+                continue
+
+            for row in binlogevent.rows:
+                release_id = (row.get('after_values') or row['values'])['id']
+                put(queues[release_id % WORKERS], (time.monotonic(), binlogevent, row))
+            rows_since_checkpoint += len(binlogevent.rows)
+    except Exception as e:
+        loop.call_soon_threadsafe(done.set_exception, e)
+    else:
+        loop.call_soon_threadsafe(done.set_result, None)
+    finally:
+        stream.close()
+
+async def main():
+    """Main binlog monitoring loop"""
+    logger.info("Starting binlog stream reader...")
+
+    loop = asyncio.get_running_loop()
+    queues = [asyncio.Queue(maxsize=QUEUE_MAXSIZE) for _ in range(WORKERS)]
+    reader_done = loop.create_future()
+    workers = [asyncio.create_task(worker(queue)) for queue in queues]
+    stats_task = asyncio.create_task(report_stats())
+
+    # Daemon thread, a reader blocked on the socket must not keep the
+    # process alive on shutdown
+    threading.Thread(
+        target=_binlog_reader_thread,
+        args=(queues, loop, reader_done),
+        name="binlog-reader",
+        daemon=True
+    ).start()
+
+    # A failed worker would leave its shard queue full and stall the reader,
+    # so stop as soon as either side is done
+    await asyncio.wait([reader_done, *workers], return_when=asyncio.FIRST_COMPLETED)
+    for task in workers:
+        if task.done():
+            task.result()
+
+    # The reader has stopped, let the workers write out what they have
+    for queue in queues:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    stats_task.cancel()
+    reader_done.result()
+
+def load_cache(path):
+    """Load a groups/sections cache file, None if missing or stale"""
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_MAX_AGE:
+            return None
+        with open(path, 'rb') as f:
+            cache = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load cache {path}: {e}")
+        return None
+
+    # The file is rewritten when new rows are added, so the age of the last
+    # full fetch is tracked separately from the mtime
+    if time.time() - cache['ts'] >= CACHE_MAX_AGE:
+        return None
+    return cache
+
+def save_cache(path, rows, max_id, ts):
+    """Write a groups/sections cache file"""
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump({'rows': rows, 'max_id': max_id, 'ts': ts}, f)
+    except Exception as e:
+        logger.warning(f"Failed to save cache {path}: {e}")
 
 async def fetch_all_groups():
     """Fetch all groups from database and cache them"""
     global groups, group_max_id_known
-    
-    logger.info("Fetching all known groups...")
+
+    cache = load_cache(GROUPS_CACHE_FILE)
+    if cache:
+        logger.info(f"Loaded {len(cache['rows'])} groups from cache. Fetching new groups...")
+    else:
+        logger.info("Fetching all known groups...")
+
     pool = await aiomysql.create_pool(
         host=MYSQL_SETTINGS['host'],
         port=MYSQL_SETTINGS['port'],
@@ -209,16 +549,31 @@ async def fetch_all_groups():
     
     async with pool.acquire() as conn:
         async with conn.cursor() as cur:
-            await cur.execute("SELECT groupid, groupname FROM `groups`")
-            rows = await cur.fetchall()
-            
-            if len(rows) < 1000:
-                logger.warning("Failed to fetch groups from database!")
-                return
-            
-            groups = dict(rows)
-            group_max_id_known = max(groups.keys()) if groups else 0
-            logger.info(f"Cached {len(groups)} groups. Max ID: {group_max_id_known}")
+            if cache:
+                await cur.execute(
+                    "SELECT groupid, groupname FROM `groups` WHERE groupid > %s",
+                    (cache['max_id'],)
+                )
+                rows = await cur.fetchall()
+
+                groups = cache['rows']
+                groups.update(rows)
+                group_max_id_known = max(groups.keys()) if groups else 0
+                if rows:
+                    save_cache(GROUPS_CACHE_FILE, groups, group_max_id_known, cache['ts'])
+                logger.info(f"Cached {len(groups)} groups ({len(rows)} new). Max ID: {group_max_id_known}")
+            else:
+                await cur.execute("SELECT groupid, groupname FROM `groups`")
+                rows = await cur.fetchall()
+
+                if len(rows) < 1000:
+                    logger.warning("Failed to fetch groups from database!")
+                    return
+
+                groups = dict(rows)
+                group_max_id_known = max(groups.keys()) if groups else 0
+                save_cache(GROUPS_CACHE_FILE, groups, group_max_id_known, time.time())
+                logger.info(f"Cached {len(groups)} groups. Max ID: {group_max_id_known}")
     
     pool.close()
     await pool.wait_closed()
@@ -226,8 +581,13 @@ async def fetch_all_groups():
 async def fetch_all_sections():
     """Fetch all sections from database and cache them"""
     global sections, section_max_id_known
-    
-    logger.info("Fetching all known sections...")
+
+    cache = load_cache(SECTIONS_CACHE_FILE)
+    if cache:
+        logger.info(f"Loaded {len(cache['rows'])} sections from cache. Fetching new sections...")
+    else:
+        logger.info("Fetching all known sections...")
+
     pool = await aiomysql.create_pool(
         host=MYSQL_SETTINGS['host'],
         port=MYSQL_SETTINGS['port'],
@@ -238,34 +598,63 @@ async def fetch_all_sections():
     
     async with pool.acquire() as conn:
         async with conn.cursor() as cur:
-            await cur.execute("SELECT sectionid, sectionname FROM sections")
-            rows = await cur.fetchall()
-            
-            if len(rows) < 40:
-                logger.warning("Failed to fetch sections from database!")
-                return
-            
-            sections = dict(rows)
-            section_max_id_known = max(sections.keys()) if sections else 0
-            logger.info(f"Cached {len(sections)} sections. Max ID: {section_max_id_known}")
+            if cache:
+                await cur.execute(
+                    "SELECT sectionid, sectionname FROM sections WHERE sectionid > %s",
+                    (cache['max_id'],)
+                )
+                rows = await cur.fetchall()
+
+                sections = cache['rows']
+                sections.update(rows)
+                section_max_id_known = max(sections.keys()) if sections else 0
+                if rows:
+                    save_cache(SECTIONS_CACHE_FILE, sections, section_max_id_known, cache['ts'])
+                logger.info(f"Cached {len(sections)} sections ({len(rows)} new). Max ID: {section_max_id_known}")
+            else:
+                await cur.execute("SELECT sectionid, sectionname FROM sections")
+                rows = await cur.fetchall()
+
+                if len(rows) < 40:
+                    logger.warning("Failed to fetch sections from database!")
+                    return
+
+                sections = dict(rows)
+                section_max_id_known = max(sections.keys()) if sections else 0
+                save_cache(SECTIONS_CACHE_FILE, sections, section_max_id_known, time.time())
+                logger.info(f"Cached {len(sections)} sections. Max ID: {section_max_id_known}")
     
     pool.close()
     await pool.wait_closed()
 
 async def test_sphinx_connection():
-    """Test connection to Sphinx RT index"""
+    """Test connection to Sphinx RT index and warm up the worker connections"""
+    conns = []
     try:
-        async with sphinx_pool.acquire() as conn:
+        # Hold every worker connection at once so each one gets exercised
+        # instead of the pool handing back the same one repeatedly
+        for _ in range(WORKERS):
+            conns.append(await sphinx_pool.acquire())
+
+        for conn in conns:
             async with conn.cursor() as cur:
-                await cur.execute("SELECT COUNT(*) FROM releases_rt LIMIT 1")
-                result = await cur.fetchone()
-                logger.info(f"Sphinx connection test successful. Index contains {result[0]} records.")
-                return True
+                await cur.execute("SELECT 1")
+
+        async with conns[0].cursor() as cur:
+            await cur.execute("SELECT COUNT(*) FROM releases_rt LIMIT 1")
+            result = await cur.fetchone()
+            logger.info(f"Sphinx connection test successful. Index contains {result[0]} records.")
+            return True
     except Exception as e:
         logger.error(f"Sphinx connection test failed: {e}")
         return False
+    finally:
+        for conn in conns:
+            sphinx_pool.release(conn)
 
 if __name__ == "__main__":
+    setup_logging()
+
     async def startup():
         """Initialize everything and start the main loop"""
         logger.info("Starting Sphinx Binlog Updater...")
@@ -289,10 +678,20 @@ if __name__ == "__main__":
         logger.info("Initialization complete. Starting binlog monitoring...")
         await main()
     
+    # uvloop.install() is deprecated from Python 3.12 on, uvloop.run()
+    # replaces it there
+    if uvloop is not None and sys.version_info >= (3, 12):
+        run = uvloop.run
+    else:
+        if uvloop is not None:
+            uvloop.install()
+        run = asyncio.run
+
     try:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(startup())
+        run(startup())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
         logger.error(f"Fatal error: {e}")
+        # Non-zero so a supervisor restarts the daemon from the saved position
+        sys.exit(1)